@@ -1,6 +1,16 @@
+import os
 import csv
 import sys
 from pathlib import Path
+from itertools import islice
+from collections import deque
+from operator import itemgetter
+
+# 1 MiB buffer for reading and writing the CSV files
+BUFFER_SIZE = 1 << 20
+
+# (key, text) from a CSV row
+first_two = itemgetter(0, 1)
 
 def create_mapping_file(source_csv, mapping_csv):
     """
@@ -10,15 +20,14 @@ def create_mapping_file(source_csv, mapping_csv):
     """
     rows_written = 0
     
-    with open(source_csv, 'r', encoding='utf-8') as fin, \
-         open(mapping_csv, 'w', encoding='utf-8', newline='') as fout:
+    with open(source_csv, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as fin, \
+         open(mapping_csv, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as fout:
         
         reader = csv.reader(fin)
         writer = csv.writer(fout, quoting=csv.QUOTE_ALL)
         
         # Skip first 3 header rows
-        for _ in range(3):
-            next(reader, None)
+        deque(islice(reader, 3), maxlen=0)
         
         for row in reader:
             if len(row) >= 3:
@@ -43,56 +52,70 @@ def build_translation_file(source_csv, mapping_csv, output_csv):
     Preserves the first 3 header rows from the source.
     """
     # Load the mapping file (key -> new_text)
-    translations = {}
-    with open(mapping_csv, 'r', encoding='utf-8') as f:
+    with open(mapping_csv, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as f:
         reader = csv.reader(f)
-        for row in reader:
-            if len(row) >= 2:
-                key = row[0]
-                new_text = row[1]
-                translations[key] = new_text
+        translations = dict(first_two(row) for row in reader if len(row) >= 2)
     
     print(f"📖 Loaded {len(translations)} translations from {mapping_csv}")
     
-    # Build the output CSV
-    rows = []
+    # Build the output CSV, streaming rows from the source into the output
     matched_count = 0
+    data_count = 0
     header_count = 0
     
-    with open(source_csv, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        
-        # Preserve first 3 header rows as-is
-        for _ in range(3):
-            header_row = next(reader, None)
-            if header_row:
-                rows.append(header_row)
-                header_count += 1
-        
-        # Process data rows
+    def translated_lines(reader):
+        nonlocal matched_count, data_count
         for row in reader:
             if len(row) >= 3:
                 key = row[0]
-                original_text = row[1]
                 
-                # Use new text from mapping, or fall back to original translation
-                if key in translations:
-                    new_text = translations[key]
-                    matched_count += 1
-                else:
+                # Use new text from mapping, or fall back to original translation.
+                # A single get() hashes the key once; None means no mapping.
+                new_text = translations.get(key)
+                if new_text is None:
                     new_text = row[2]  # Keep original if no mapping exists
+                else:
+                    matched_count += 1
+                
+                data_count += 1
                 
-                rows.append([key, original_text, new_text])
+                # Preformatted line with the same output as csv.writer with
+                # QUOTE_ALL: every field quoted, embedded quotes doubled, CRLF
+                yield '"%s","%s","%s"\r\n' % (
+                    key.replace('"', '""'),
+                    row[1].replace('"', '""'),
+                    new_text.replace('"', '""'),
+                )
     
-    # Write the final CSV
-    with open(output_csv, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-        writer.writerows(rows)
+    # Stream into a temporary file and only move it over the output once the
+    # whole source has been read, so a failed build leaves the output untouched
+    tmp_csv = f"{output_csv}.tmp"
+    try:
+        with open(source_csv, 'r', encoding='utf-8', buffering=BUFFER_SIZE) as fin, \
+             open(tmp_csv, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as fout:
+            
+            reader = csv.reader(fin)
+            
+            # Preserve first 3 header rows as-is, quoted the same way as data rows
+            for _ in range(3):
+                header_row = next(reader, None)
+                if header_row:
+                    fout.write('"' + '","'.join([field.replace('"', '""') for field in header_row]) + '"\r\n')
+                    header_count += 1
+            
+            # Process data rows as they are read instead of buffering them all
+            fout.writelines(translated_lines(reader))
+        
+        os.replace(tmp_csv, output_csv)
+    except BaseException:
+        if os.path.exists(tmp_csv):
+            os.remove(tmp_csv)
+        raise
     
     print(f"✅ Created translation file: {output_csv}")
     print(f"   Preserved {header_count} header rows")
     print(f"   Updated {matched_count} translations")
-    print(f"   Total rows: {len(rows)}")
+    print(f"   Total rows: {header_count + data_count}")
 
 
 def main():